@@ -19,11 +19,16 @@ Week navigation  : frame.locator("svg").nth(2)  → next week
                    frame.locator("svg").nth(1)  → previous week
 
 Register flow    : slot.click()  →  button "רישום".click()
+                   (run as a single in-frame script, see _CLICK_SLOT_THEN_BUTTON_JS)
 Cancel flow      : slot.click()  →  button "ביטול הרשמה".click()
                                  →  button "כן, לבטל בבקשה".click()
 
 Already-registered detection: after slot.click(), if "ביטול הרשמה" appears
                                instead of "רישום" the user is already booked.
+
+register_class and cancel_class report failures as a message instead of
+raising; an unexpected error also sets ``page._arbox_failed`` so a long-lived
+owner of the page (arbox_session.ArboxSession) knows to replace it.
 """
 
 from __future__ import annotations
@@ -36,6 +41,7 @@ from datetime import date, datetime, timedelta
 import pytz
 
 import config
+from browser_session import _navigate_to_schedule, _wait_for_arbox_frame, extra_pages
 
 logger = logging.getLogger(__name__)
 TZ = pytz.timezone(config.TIMEZONE)
@@ -56,6 +62,14 @@ _HEBREW_DAY_ABBREV: dict[int, str] = {
     6: "א׳",  # Sunday
 }
 
+# Upper bound on browser contexts registering at once in batch_register_next_week.
+# Kept small so a burst doesn't trip Arbox's rate limiting.
+_MAX_PARALLEL_REGISTRATIONS = 3
+
+# Compiled once — these run for every slot in the per-slot loops.
+_SLOT_CAPACITY_RE = re.compile(r"(\d+)/(\d+)")        # "15/20" → taken, total
+_START_TIME_RE    = re.compile(r"\s*(\d{2}:\d{2})")    # leading "HH:MM" of "07:00 - 08:00"
+
 
 def next_weekday(day_name: str, reference: date | None = None) -> date:
     """Return the next occurrence of day_name on or after reference (default: today)."""
@@ -74,59 +88,283 @@ def _day_header(target: date) -> str:
     return f"{target.day}{_HEBREW_DAY_ABBREV[target.weekday()]}"
 
 
+def _day_header_re(target: date) -> re.Pattern:
+    """
+    Loose pattern for the column header of *target*: tolerates whitespace
+    between day number and letter and a missing or ASCII geresh, and won't
+    match inside a longer number ("7ו׳" vs "17ו׳").
+    """
+    letter = _HEBREW_DAY_ABBREV[target.weekday()][0]
+    return re.compile(rf"(?<!\d){target.day}\s*{letter}[׳'’]?")
+
+
 def _is_full(slot_text: str) -> bool:
     """
     Return True if the slot is full.
     Slot text contains "{taken}/{total}" — full when taken >= total.
     e.g. "20/20" or "20/20(9)" → full.  "4/20" → not full.
     """
-    m = re.search(r"(\d+)/(\d+)", slot_text)
+    m = _SLOT_CAPACITY_RE.search(slot_text)
     if m:
         return int(m.group(1)) >= int(m.group(2))
     return False
 
 
-def _get_frame(page):
+# Runs over every .date-events-wrapper in one evaluate_all() round-trip and
+# returns, per day, the text of each class slot and whether it matches
+# config.REGISTERED_SLOT_SELECTOR.
+_WEEK_SNAPSHOT_JS = """
+(wrappers, [className, registeredSelector]) => wrappers.map(w =>
+    [...w.querySelectorAll('.session-wrapper')]
+        .filter(s => s.innerText.includes(className))
+        .map(s => ({text: s.innerText, registered: s.matches(registeredSelector)}))
+)
+"""
+
+# Texts of every .session-wrapper, grouped per .date-events-wrapper (day).
+_WEEK_TEXTS_JS = """
+wrappers => wrappers.map(w =>
+    [...w.querySelectorAll('.session-wrapper')].map(s => s.innerText))
+"""
+
+# Register hot path, run inside the schedule frame in one round-trip: click
+# the slot, then poll the modal for a visible button.  *buttonName* is clicked
+# and resolves "clicked"; *otherName* (the alternative outcome) resolves
+# "other" without clicking; "none" on timeout.  Clicks are dispatched DOM
+# events, same as Locator.dispatch_event("click").
+_CLICK_SLOT_THEN_BUTTON_JS = """
+async (slot, {buttonName, otherName, timeoutMs}) => {
+    const click = el => el.dispatchEvent(
+        new MouseEvent('click', {bubbles: true, cancelable: true, composed: true}));
+    const findButton = name => [...document.querySelectorAll('button, [role="button"]')]
+        .find(b => b.getClientRects().length > 0 &&
+                   (b.getAttribute('aria-label') || b.textContent || '').includes(name));
+    click(slot);
+    const deadline = performance.now() + timeoutMs;
+    while (performance.now() < deadline) {
+        const btn = findButton(buttonName);
+        if (btn) { click(btn); return 'clicked'; }
+        if (findButton(otherName)) return 'other';
+        await new Promise(r => setTimeout(r, 50));
+    }
+    return 'none';
+}
+"""
+
+
+def _get_frame(page, frame=None):
     """
     Return the main arboxapp.com schedule frame.
 
     page.frame_locator("iframe").first does not reliably target the schedule
     frame — there are multiple iframes and the schedule is not always first.
     Instead we search page.frames for the first arboxapp.com entry.
+
+    Pass an already-resolved *frame* to skip the page.frames scan — it is
+    returned as-is, so callers can resolve once and thread it through.
+
+    The resolved frame is memoized on the page as ``page._arbox_frame`` and
+    reused until it detaches; browser_session._navigate_to_schedule clears it.
     """
+    if frame is not None:
+        return frame
+    cached = getattr(page, "_arbox_frame", None)
+    if cached is not None and not cached.is_detached():
+        return cached
     for f in page.frames[1:]:   # frames[0] is the host page itself
         if "arboxapp.com" in f.url:
+            page._arbox_frame = f
             return f
-    return page.frame_locator("iframe").first   # fallback
+    return page.frame_locator("iframe").first   # fallback (not cached)
 
 
 # ── Week navigation ───────────────────────────────────────────────────────────
 
-async def _navigate_to_week_of(page, target: date) -> None:
+_FRAME_TEXT_JS = "() => document.body.innerText"
+
+
+async def _frame_text(frame) -> str | None:
+    """Whole text of the schedule frame, or None for a FrameLocator fallback."""
+    if not hasattr(frame, "evaluate"):
+        return None
+    try:
+        return await frame.evaluate(_FRAME_TEXT_JS)
+    except Exception:
+        return None
+
+
+async def _wait_for_week(frame, day: date, before: str | None = None) -> None:
     """
-    Click the next/previous SVG arrow until the week containing *target* is shown.
+    Wait until the week containing *day* is on screen.  Returns as soon as
+    the DOM updates instead of sleeping a fixed amount after every arrow click.
 
-    svg.nth(2) = next-week  |  svg.nth(1) = previous-week  (from recording)
+    *before* is the frame text (_frame_text) captured just before the click;
+    the frame text changing from it is the signal that the new week has
+    rendered, whether or not the header pattern below matches.  The column
+    header for *day* is then checked as confirmation.
     """
-    frame = _get_frame(page)
+    if before is not None:
+        try:
+            await frame.wait_for_function(
+                "prev => document.body.innerText !== prev", arg=before, timeout=5_000
+            )
+        except Exception:
+            logger.warning("Schedule did not change after week navigation to %s", day)
+
+    try:
+        await frame.get_by_text(_day_header_re(day)).first.wait_for(
+            state="visible", timeout=5_000 if before is None else 1_500
+        )
+    except Exception:
+        # Header text not found (markup change?) — make sure at least the
+        # day columns are there before the caller starts reading them.
+        logger.warning("Week header %s not found, waiting for day columns", _day_header(day))
+        await frame.locator(".date-events-wrapper").first.wait_for(
+            state="visible", timeout=5_000
+        )
 
-    def _week_start(d: date) -> date:
-        return d - timedelta(days=(d.weekday() + 1) % 7)
 
-    today = datetime.now(TZ).date()
-    weeks = (_week_start(target) - _week_start(today)).days // 7
+async def _jump_to_date(frame, target: date) -> bool | None:
+    """
+    Jump straight to *target* through a date input, if the schedule has one.
 
-    for _ in range(weeks):
+    Not seen in the recording — this is a best-effort probe.  Returns True
+    when the expected week came up, False when no input is present (the view
+    is untouched; caller falls back to arrow clicks), and None when the date
+    was entered but the week could not be confirmed — the view may or may
+    not have moved, so the displayed week is unknown.
+    """
+    picker = frame.locator("input[type='date']").or_(
+        frame.get_by_role("textbox", name=re.compile(r"date|תאריך", re.IGNORECASE))
+    ).first
+    try:
+        if not await picker.is_visible():
+            return False
+    except Exception:
+        return False
+    try:
+        await picker.fill(target.isoformat())
+        await picker.press("Enter")
+        await frame.get_by_text(_day_header_re(target)).first.wait_for(
+            state="visible", timeout=5_000
+        )
+        return True
+    except Exception:
+        logger.warning("Date-picker jump to %s could not be confirmed", target)
+        return None
+
+
+async def _navigate_to_week_of(page, target: date, frame=None, today: date | None = None) -> None:
+    """
+    Click the next/previous SVG arrow until the week containing *target* is shown.
+
+    svg.nth(2) = next-week  |  svg.nth(1) = previous-week  (from recording)
+
+    After each click waits for the schedule to re-render and checks the header
+    of the week that should now be displayed, so the view is up to date when
+    this returns.  Jumps of more than one week try the date picker first (one
+    step instead of one per week).
+
+    The week on screen is read from ``page._arbox_shown_week``, recorded by
+    browser_session._wait_for_arbox_frame when the schedule loaded and
+    updated here after every move, so a page reused across actions (and
+    across midnight) navigates from what it really shows.  Only a page that
+    wasn't loaded through browser_session falls back to the week of *today*,
+    the caller's reference date.
+    """
+    frame = _get_frame(page, frame)
+
+    if today is None:
+        today = datetime.now(TZ).date()
+    shown = getattr(page, "_arbox_shown_week", None) or _week_start(today)
+    weeks = (_week_start(target) - shown).days // 7
+
+    if abs(weeks) > 1:
+        jumped = await _jump_to_date(frame, target)
+        if jumped:
+            page._arbox_shown_week = _week_start(target)
+            return
+        if jumped is None:
+            # Unknown week on screen — reload so the arrows start from a
+            # known view instead of clicking from a possibly wrong one.
+            await _navigate_to_schedule(page)
+            frame = await _wait_for_arbox_frame(page)
+            shown = page._arbox_shown_week
+            weeks = (_week_start(target) - shown).days // 7
+
+    for step in range(1, weeks + 1):
+        before = await _frame_text(frame)
         await frame.locator("svg").nth(2).click()
-        await asyncio.sleep(1.5)
-    for _ in range(-weeks):
+        page._arbox_shown_week = shown + timedelta(weeks=step)
+        await _wait_for_week(frame, target - timedelta(weeks=weeks - step), before)
+    for step in range(1, -weeks + 1):
+        before = await _frame_text(frame)
         await frame.locator("svg").nth(1).click()
-        await asyncio.sleep(1.5)
+        page._arbox_shown_week = shown - timedelta(weeks=step)
+        await _wait_for_week(frame, target + timedelta(weeks=-weeks - step), before)
+
+    if weeks == 0:
+        # Nothing clicked — the schedule was already waited on when it loaded
+        # (browser_session._wait_for_arbox_frame) or by the last navigation.
+        page._arbox_shown_week = shown
 
 
 # ── Slot finder ───────────────────────────────────────────────────────────────
 
-async def _find_class_slot(page, target: date, time_str: str):
+def _week_start(d: date) -> date:
+    """Return the Sunday that starts the Arbox week containing *d*."""
+    return d - timedelta(days=(d.weekday() + 1) % 7)
+
+
+async def _build_week_index(
+    frame, week_start: date
+) -> tuple[int, dict[tuple[date, str], tuple[int, int, bool]]]:
+    """
+    Read every slot of the displayed week in one evaluate_all() call and map
+    (date, "HH:MM" start time) → (day column index, slot index in that column,
+    whether the slot is config.CLASS_NAME).
+
+    A slot containing config.CLASS_NAME wins over any other class at the same
+    start time (avoids picking Open GYM); otherwise the first slot is kept.
+    Returns (number of day columns, index).
+    """
+    week = await frame.locator(".date-events-wrapper").evaluate_all(_WEEK_TEXTS_JS)
+
+    index: dict[tuple[date, str], tuple[int, int, bool]] = {}
+    fallback: dict[tuple[date, str], tuple[int, int, bool]] = {}
+    for day_idx, texts in enumerate(week):
+        day = week_start + timedelta(days=day_idx)
+        for slot_idx, slot_text in enumerate(texts):
+            m = _START_TIME_RE.match(slot_text)
+            if not m:
+                continue
+            is_class = config.CLASS_NAME in slot_text
+            bucket = index if is_class else fallback
+            bucket.setdefault((day, m.group(1)), (day_idx, slot_idx, is_class))
+
+    return len(week), {**fallback, **index}
+
+
+async def _week_index(page, frame, week_start: date):
+    """
+    Memoized _build_week_index, cached on the page as ``page._arbox_week_index``
+    keyed by week start.  browser_session._navigate_to_schedule clears the
+    cache on reload.  Positions can go stale if Arbox adds or removes a
+    session meanwhile, so callers that click a slot verify it first
+    (_checked_slot).
+    """
+    cache = getattr(page, "_arbox_week_index", None)
+    if cache is None:
+        cache = page._arbox_week_index = {}
+    if week_start not in cache:
+        wrapper_count, index = await _build_week_index(frame, week_start)
+        if wrapper_count == 0:
+            return wrapper_count, index   # not rendered yet — don't cache
+        cache[week_start] = (wrapper_count, index)
+    return cache[week_start]
+
+
+async def _find_class_slot(page, target: date, time_str: str, frame=None, today: date | None = None):
     """
     Return the Locator for the session-wrapper slot on *target* at *time_str*.
 
@@ -134,22 +372,31 @@ async def _find_class_slot(page, target: date, time_str: str):
       1. Navigate to the correct week.
       2. Select the .date-events-wrapper at the Sunday-first column index.
          Index formula: (target.weekday() + 1) % 7  (Mon=1, Fri=5, Sun=0)
-      3. Inside it, filter .session-wrapper by "{time_str} -" (start-time)
-         and optionally by config.CLASS_NAME to avoid picking Open GYM.
+      3. Inside it, pick the .session-wrapper whose start time is *time_str*,
+         preferring one that contains config.CLASS_NAME to avoid picking
+         Open GYM.  Positions come from the per-week index (_week_index).
 
     Raises ValueError if no matching slot is found.
     """
-    await _navigate_to_week_of(page, target)
-    await asyncio.sleep(1.5)   # let the view re-render after navigation
+    frame = _get_frame(page, frame)
+    await _navigate_to_week_of(page, target, frame, today)
+    return await _find_class_slot_no_nav(page, target, time_str, frame)
 
-    frame = _get_frame(page)
+
+async def _find_class_slot_no_nav(page, target: date, time_str: str, frame=None):
+    """
+    Same as _find_class_slot, but assumes the week containing *target* is
+    already displayed (steps 2–3 only).  Lets batch callers navigate once
+    and then look up several slots in the same week.
+    """
+    frame = _get_frame(page, frame)
 
     # Arbox week starts on Sunday (index 0).
     # Python weekday(): Mon=0, Tue=1, …, Sun=6
     # → Sunday-first index = (weekday + 1) % 7
     col_idx = (target.weekday() + 1) % 7
 
-    wrapper_count = await frame.locator(".date-events-wrapper").count()
+    wrapper_count, index = await _week_index(page, frame, _week_start(target))
     if wrapper_count == 0:
         raise ValueError(
             "No .date-events-wrapper found — the schedule iframe may not have "
@@ -161,39 +408,61 @@ async def _find_class_slot(page, target: date, time_str: str):
             f"Target: {target.strftime('%A %d/%m')}."
         )
 
-    day_wrapper = frame.locator(".date-events-wrapper").nth(col_idx)
-
-    # Filter by "{time_str} -" so we match the START time only.
-    # e.g. "08:00 -" matches "08:00 - 09:00" but not "07:00 - 08:00".
-    start_filter = f"{time_str} -"
+    position = index.get((target, time_str))
+    if position is None:
+        raise ValueError(
+            f"No class slot found for {target.strftime('%A %d/%m')} at {time_str}.\n"
+            f"Day column index: {col_idx} (Sunday=0 … Saturday=6), "
+            f"columns visible: {wrapper_count}.\n"
+            "Run with arbox_page(headless=False) to inspect the DOM."
+        )
 
-    # Primary: start-time + class name (avoids picking Open GYM by mistake)
-    slot = (
-        day_wrapper.locator(".session-wrapper")
-        .filter(has_text=start_filter)
-        .filter(has_text=config.CLASS_NAME)
-        .first
-    )
-    if await slot.count() > 0 and await slot.is_visible():
-        return slot
-
-    # Fallback: start-time only (in case CLASS_NAME text differs)
-    slot = (
-        day_wrapper.locator(".session-wrapper")
-        .filter(has_text=start_filter)
-        .first
-    )
-    if await slot.count() > 0 and await slot.is_visible():
-        return slot
-
-    raise ValueError(
-        f"No class slot found for {target.strftime('%A %d/%m')} at {time_str}.\n"
-        f"Day column index: {col_idx} (Sunday=0 … Saturday=6), "
-        f"columns visible: {wrapper_count}.\n"
-        "Run with arbox_page(headless=False) to inspect the DOM."
+    day_idx, slot_idx, _ = position
+    return (
+        frame.locator(".date-events-wrapper").nth(day_idx)
+        .locator(".session-wrapper").nth(slot_idx)
     )
 
 
+async def _checked_slot(page, target: date, time_str: str, frame, today: date, navigate: bool):
+    """
+    Resolve the slot for *target* at *time_str* and read its text, making
+    sure it really starts at *time_str*.
+
+    The week index only stores positions and lives as long as the page, so
+    a session Arbox added or removed since it was built shifts the column.
+    If the slot's start time differs (or it was indexed as config.CLASS_NAME
+    but no longer is) the week's index is dropped and rebuilt once; if the
+    rebuilt slot still doesn't start at *time_str*, ValueError.
+    Returns (slot locator, text).
+    """
+    if navigate:
+        slot = await _find_class_slot(page, target, time_str, frame, today)
+    else:
+        slot = await _find_class_slot_no_nav(page, target, time_str, frame)
+    slot_text = await slot.inner_text()
+    m = _START_TIME_RE.match(slot_text)
+    # The lookup above just cached this week's index on the page.
+    _, index = page._arbox_week_index[_week_start(target)]
+    is_class = index[(target, time_str)][2]
+    if m and m.group(1) == time_str and (not is_class or config.CLASS_NAME in slot_text):
+        return slot, slot_text
+
+    logger.info("Week index for %s is stale — rebuilding", _week_start(target))
+    cache = getattr(page, "_arbox_week_index", None)
+    if cache:
+        cache.pop(_week_start(target), None)
+    slot = await _find_class_slot_no_nav(page, target, time_str, frame)
+    slot_text = await slot.inner_text()
+    m = _START_TIME_RE.match(slot_text)
+    if not (m and m.group(1) == time_str):
+        raise ValueError(
+            f"Slot for {target.strftime('%A %d/%m')} at {time_str} changed while "
+            "it was being opened — try again."
+        )
+    return slot, slot_text
+
+
 # ── Available-slots query ─────────────────────────────────────────────────────
 
 async def get_available_slots(page, target: date) -> list[str]:
@@ -204,29 +473,27 @@ async def get_available_slots(page, target: date) -> list[str]:
     Returns a sorted, deduplicated list of "HH:MM" strings.
     Full classes are included — register_class handles the full-class error.
     """
-    await _navigate_to_week_of(page, target)
-    await asyncio.sleep(1.5)
-
+    today = datetime.now(TZ).date()
     frame = _get_frame(page)
+    await _navigate_to_week_of(page, target, frame, today)
+
     col_idx = (target.weekday() + 1) % 7
 
-    wrapper_count = await frame.locator(".date-events-wrapper").count()
-    if wrapper_count == 0 or col_idx >= wrapper_count:
+    day_wrappers = await frame.locator(".date-events-wrapper").all()
+    if col_idx >= len(day_wrappers):
         return []
 
-    day_wrapper = frame.locator(".date-events-wrapper").nth(col_idx)
+    day_wrapper = day_wrappers[col_idx]
     slots = day_wrapper.locator(".session-wrapper").filter(has_text=config.CLASS_NAME)
-    slot_count = await slots.count()
 
-    times: set[str] = set()
-    for slot_idx in range(slot_count):
-        slot = slots.nth(slot_idx)
-        slot_text = await slot.inner_text()
-        m = re.match(r"(\d{2}:\d{2})", slot_text.strip())
-        if m:
-            times.add(m.group(1))
+    # One round-trip for every slot's text instead of one inner_text() each.
+    times = {
+        m.group(1)
+        for slot_text in await slots.all_inner_texts()
+        if (m := _START_TIME_RE.match(slot_text))
+    }
 
-    # Each DOM slot contains a full "HH:MM - HH:MM" time range, so re.match
+    # Each DOM slot contains a full "HH:MM - HH:MM" time range, so the match
     # always captures the START time.  Using a set removes any exact duplicates
     # from elements that share the same start time; no 60-min heuristic is
     # applied here because consecutive real classes (e.g. 17:00, 18:00, 19:00)
@@ -236,7 +503,7 @@ async def get_available_slots(page, target: date) -> list[str]:
 
 # ── Public action functions ───────────────────────────────────────────────────
 
-async def register_class(page, target: date, time_str: str) -> str:
+async def register_class(page, target: date, time_str: str, navigate: bool = True) -> str:
     """
     Register for the class on *target* at *time_str*.
 
@@ -247,40 +514,49 @@ async def register_class(page, target: date, time_str: str) -> str:
     Also handles:
       - Full class  (detected from slot text "N/N")
       - Already registered  (detected when "ביטול הרשמה" appears instead of "רישום")
+
+    Pass navigate=False when the week containing *target* is already shown.
     """
+    today = datetime.now(TZ).date()
     try:
-        slot = await _find_class_slot(page, target, time_str)
+        frame = _get_frame(page)
+        slot, slot_text = await _checked_slot(page, target, time_str, frame, today, navigate)
 
         # Pre-click check: is the class full?
-        slot_text = await slot.inner_text()
         if _is_full(slot_text):
-            m = re.search(r"\d+/\d+", slot_text)
+            m = _SLOT_CAPACITY_RE.search(slot_text)
             spots = m.group(0) if m else "?"
             return f"Class is full ({spots}) — {target.strftime('%A %d/%m')} at {time_str}."
 
-        await slot.dispatch_event("click")
-        frame = _get_frame(page)
-
-        # Give the modal 3 s to show one of the two buttons
         register_btn = frame.get_by_role("button", name="רישום")
-        cancel_btn   = frame.get_by_role("button", name="ביטול הרשמה")
 
-        try:
-            await register_btn.wait_for(state="visible", timeout=3_000)
-            await register_btn.dispatch_event("click")
-            await asyncio.sleep(0.8)
+        # Slot click + wait for "רישום" + its click as one in-frame script
+        # (up to 3 s for the modal) — this is the step that races other
+        # members when registration opens.  The same script reports whether
+        # "ביטול הרשמה" showed up instead, so no second probe is needed.
+        outcome = await slot.evaluate(
+            _CLICK_SLOT_THEN_BUTTON_JS,
+            {"buttonName": "רישום", "otherName": "ביטול הרשמה", "timeoutMs": 3_000},
+        )
+        if outcome == "clicked":
+            # The modal closes once Arbox accepts the booking.
+            try:
+                await register_btn.wait_for(state="hidden", timeout=2_000)
+            except Exception:
+                pass
             return f"Registered for {target.strftime('%A %d/%m')} at {time_str}."
-        except Exception:
-            # If the cancel button appeared instead, user is already registered
-            if await cancel_btn.is_visible():
-                await page.keyboard.press("Escape")
-                return f"Already registered for {target.strftime('%A %d/%m')} at {time_str}."
-            raise
+
+        # If the cancel button appeared instead, user is already registered
+        if outcome == "other":
+            await page.keyboard.press("Escape")
+            return f"Already registered for {target.strftime('%A %d/%m')} at {time_str}."
+        raise RuntimeError('"רישום" button did not appear after opening the slot.')
 
     except ValueError as exc:
         return str(exc)
     except Exception as exc:
         logger.exception("register_class failed")
+        page._arbox_failed = True
         return f"Error while registering: {exc}"
 
 
@@ -293,11 +569,12 @@ async def cancel_class(page, target: date, time_str: str) -> str:
         frame.get_by_role("button", name="ביטול הרשמה").click()
         frame.get_by_role("button", name="כן, לבטל בבקשה").click()
     """
+    today = datetime.now(TZ).date()
     try:
-        slot = await _find_class_slot(page, target, time_str)
+        frame = _get_frame(page)
+        slot, _ = await _checked_slot(page, target, time_str, frame, today, navigate=True)
         await slot.dispatch_event("click")
 
-        frame = _get_frame(page)
         cancel_btn = frame.get_by_role("button", name="ביטול הרשמה")
 
         try:
@@ -313,13 +590,18 @@ async def cancel_class(page, target: date, time_str: str) -> str:
         await confirm_btn.wait_for(state="visible", timeout=5_000)
         await confirm_btn.dispatch_event("click")
 
-        await asyncio.sleep(0.8)
+        # The confirmation dialog closes once Arbox accepts the cancellation.
+        try:
+            await confirm_btn.wait_for(state="hidden", timeout=2_000)
+        except Exception:
+            pass
         return f"Cancelled {target.strftime('%A %d/%m')} at {time_str}."
 
     except ValueError as exc:
         return str(exc)
     except Exception as exc:
         logger.exception("cancel_class failed")
+        page._arbox_failed = True
         return f"Error while cancelling: {exc}"
 
 
@@ -331,72 +613,90 @@ async def get_registered_classes(page) -> list[dict]:
     Strategy:
       - Explicitly navigates to the current week so the scan always starts
         from the right view regardless of any prior navigation.
-      - Iterates every .date-events-wrapper (one per day) and every
-        .session-wrapper that contains config.CLASS_NAME.
-      - Opens each slot modal and waits (up to 2 s) for "ביטול הרשמה" to
-        appear — the confirmed indicator that the user is registered.
-      - Closes the modal with Escape before moving to the next slot.
+      - With config.REGISTERED_SLOT_SELECTOR set, reads the text and
+        registration marker of every .session-wrapper that contains
+        config.CLASS_NAME, for all days, in a single evaluate_all() call;
+        no modal is ever opened.
+      - Otherwise uses the modal probe: open each slot, wait briefly for
+        "ביטול הרשמה" — the confirmed indicator that the user is
+        registered — then close the modal with Escape.
 
     Returns a list of dicts:  {"date": date, "time": str}
     """
     today = datetime.now(TZ).date()
 
+    frame = _get_frame(page)
+
     # Always start from the current week so prior navigation doesn't skew results.
-    await _navigate_to_week_of(page, today)
-    await asyncio.sleep(1.5)
+    await _navigate_to_week_of(page, today, frame, today)
 
     days_since_sunday = (today.weekday() + 1) % 7
     this_sunday = today - timedelta(days=days_since_sunday)
 
-    frame = _get_frame(page)
     registered: list[dict] = []
 
-    wrapper_count = await frame.locator(".date-events-wrapper").count()
-    if wrapper_count == 0:
-        return []
-
-    for col_idx in range(wrapper_count):
-        target_date = this_sunday + timedelta(days=col_idx)
-
-        # Skip days that have already passed — no registrations to show there.
-        if target_date < today:
-            continue
-
-        day_wrapper = frame.locator(".date-events-wrapper").nth(col_idx)
-
-        slots = day_wrapper.locator(".session-wrapper").filter(has_text=config.CLASS_NAME)
-        slot_count = await slots.count()
-
-        for slot_idx in range(slot_count):
-            slot = slots.nth(slot_idx)
-
-            # Extract start time from slot text ("07:00 - 08:00\n...")
-            slot_text = await slot.inner_text()
-            m = re.match(r"(\d{2}:\d{2})", slot_text.strip())
-            time_str = m.group(1) if m else "?"
-
-            # Open the slot modal
-            await slot.dispatch_event("click")
+    wrappers = frame.locator(".date-events-wrapper")
 
-            # 800 ms is generous for the Arbox modal (typically opens in <400 ms).
-            # Cutting this from 2 000 ms saves ~1.2 s on every non-registered slot.
-            cancel_btn = frame.get_by_role("button", name="ביטול הרשמה")
-            is_registered = False
-            try:
-                await cancel_btn.wait_for(state="visible", timeout=800)
-                is_registered = True
-            except Exception:
-                pass  # button didn't appear → not registered
+    def _start_time(slot_text: str) -> str:
+        # Extract start time from slot text ("07:00 - 08:00\n...")
+        m = _START_TIME_RE.match(slot_text)
+        return m.group(1) if m else "?"
 
-            if is_registered:
-                registered.append({"date": target_date, "time": time_str})
+    if config.REGISTERED_SLOT_SELECTOR:
+        week = await wrappers.evaluate_all(
+            _WEEK_SNAPSHOT_JS, [config.CLASS_NAME, config.REGISTERED_SLOT_SELECTOR]
+        )
+        for col_idx, day in enumerate(week):
+            target_date = this_sunday + timedelta(days=col_idx)
+            # Skip days that have already passed — no registrations to show there.
+            if target_date < today:
+                continue
+            registered.extend(
+                {"date": target_date, "time": _start_time(s["text"])}
+                for s in day if s["registered"]
+            )
+    else:
+        day_wrappers = await wrappers.all()
+        for col_idx, day_wrapper in enumerate(day_wrappers):
+            target_date = this_sunday + timedelta(days=col_idx)
+
+            # Skip days that have already passed — no registrations to show there.
+            if target_date < today:
+                continue
+
+            slots = day_wrapper.locator(".session-wrapper").filter(has_text=config.CLASS_NAME)
+            # Snapshot slot handles once rather than re-resolving .nth(i) per
+            # iteration.  Texts come from the same locator so they pair up
+            # index-for-index (has_text matching differs from the snapshot's
+            # innerText.includes, so the snapshot can't be zipped with these).
+            slot_handles = await slots.all()
+            slot_texts = await slots.all_inner_texts()
+
+            for slot, slot_text in zip(slot_handles, slot_texts):
+                time_str = _start_time(slot_text)
+
+                # Open the slot modal
+                await slot.dispatch_event("click")
+
+                # 800 ms is generous for the Arbox modal (typically opens in <400 ms).
+                # Cutting this from 2 000 ms saves ~1.2 s on every non-registered slot.
+                cancel_btn = frame.get_by_role("button", name="ביטול הרשמה")
+                is_registered = False
+                try:
+                    await cancel_btn.wait_for(state="visible", timeout=800)
+                    is_registered = True
+                except Exception:
+                    pass  # button didn't appear → not registered
+
+                if is_registered:
+                    registered.append({"date": target_date, "time": time_str})
 
-            await page.keyboard.press("Escape")
-            try:
-                await cancel_btn.wait_for(state="hidden", timeout=1_000)
-            except Exception:
-                pass
-            await asyncio.sleep(0.15)
+                await page.keyboard.press("Escape")
+                try:
+                    await cancel_btn.wait_for(state="hidden", timeout=1_000)
+                except Exception:
+                    pass
+                await asyncio.sleep(0.15)
 
     # Each class slot produces two DOM elements: one anchored at the start time
     # and one at the end time (e.g. "08:00" and "09:00" for an 08:00-09:00 class).
@@ -406,35 +706,86 @@ async def get_registered_classes(page) -> list[dict]:
     def _mins(t: str) -> int:
         return int(t[:2]) * 60 + int(t[3:])
 
-    times_per_day: dict[date, set[str]] = {}
+    minutes_per_day: dict[date, set[int]] = {}
     for item in registered:
-        times_per_day.setdefault(item["date"], set()).add(item["time"])
+        minutes_per_day.setdefault(item["date"], set()).add(_mins(item["time"]))
 
     return [
         item for item in registered
-        if not any(
-            _mins(earlier) == _mins(item["time"]) - 60
-            for earlier in times_per_day[item["date"]]
-        )
+        if _mins(item["time"]) - 60 not in minutes_per_day[item["date"]]
     ]
 
 
+async def register_many(
+    page, targets: list[tuple[date, str]], week_of: date | None = None
+) -> list[str]:
+    """
+    Register for every (date, "HH:MM") in *targets*; returns one message each,
+    in the same order.
+
+    Targets are spread round-robin over up to _MAX_PARALLEL_REGISTRATIONS
+    pages (*page* plus sibling contexts from extra_pages) and each page works
+    through its share serially.  If all targets fall in one week, pass any
+    date of it as *week_of*: each page then navigates there once and skips
+    per-class week navigation.
+
+    Siblings that fail to open just mean fewer workers (down to *page* alone),
+    and a worker that fails only loses its own targets — each gets an error
+    message instead of the whole batch failing.
+    """
+    if not targets:
+        return []
+
+    today = datetime.now(TZ).date()
+    results: list[str] = [""] * len(targets)
+
+    def _error(i: int, exc: BaseException) -> str:
+        target, time_str = targets[i]
+        return f"Error while registering {target.strftime('%A %d/%m')} at {time_str}: {exc}"
+
+    async def _worker(worker_page, indices: range) -> None:
+        if week_of is not None:
+            await _navigate_to_week_of(worker_page, week_of, today=today)
+        for i in indices:
+            target, time_str = targets[i]
+            msg = await register_class(
+                worker_page, target, time_str, navigate=week_of is None
+            )
+            logger.info(msg)
+            results[i] = msg
+
+    wanted = min(_MAX_PARALLEL_REGISTRATIONS, len(targets))
+    async with extra_pages(page, wanted - 1) as siblings:
+        pages = [page, *siblings]
+        shares = [range(w, len(targets), len(pages)) for w in range(len(pages))]
+        outcomes = await asyncio.gather(
+            *(_worker(p, share) for p, share in zip(pages, shares)),
+            return_exceptions=True,
+        )
+
+    for p, share, outcome in zip(pages, shares, outcomes):
+        if isinstance(outcome, BaseException):
+            logger.error("Registration worker failed", exc_info=outcome)
+            p._arbox_failed = True
+            for i in share:
+                if not results[i]:
+                    results[i] = _error(i, outcome)
+
+    return results
+
+
 async def batch_register_next_week(page) -> list[str]:
     """
     Register for every class in config.WEEKLY_CLASSES for the coming week.
     Called by the Saturday 21:00 scheduler and by /bookweek.
     """
-    results: list[str] = []
-
     today = datetime.now(TZ).date()
     days_until_sunday = (6 - today.weekday()) % 7 or 7
     next_sunday = today + timedelta(days=days_until_sunday)
 
-    for cls in config.WEEKLY_CLASSES:
-        target = next_weekday(cls["day"], reference=next_sunday)
-        msg = await register_class(page, target, cls["time"])
-        logger.info(msg)
-        results.append(msg)
-        await asyncio.sleep(1.0)
-
-    return results
+    targets = [
+        (next_weekday(cls["day"], reference=next_sunday), cls["time"])
+        for cls in config.WEEKLY_CLASSES
+    ]
+    # All in next week — navigate there once per page.
+    return await register_many(page, targets, week_of=next_sunday)
@@ -0,0 +1,117 @@
+"""
+Long-lived Arbox session for the Telegram bot.
+
+Keeps one logged-in schedule page (from browser_session.arbox_page) open
+between commands and runs the arbox_actions on it, one at a time.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from contextlib import AsyncExitStack, asynccontextmanager
+from datetime import date
+
+from playwright.async_api import Page
+
+import config
+from arbox_actions import cancel_class, get_available_slots, get_registered_classes, register_class
+from browser_session import arbox_page
+
+logger = logging.getLogger(__name__)
+
+
+class ArboxSession:
+    """
+    One authenticated page kept open for the lifetime of the bot process.
+
+    Wraps arbox_page() so a command doesn't pay for browser launch, session
+    check and schedule load every time.  All callers are serialized on an
+    asyncio.Lock because the actions drive a single page.  The page is
+    reopened once it is older than config.SESSION_MAX_AGE (arbox_page then
+    re-checks a login not confirmed within that time), and after an action
+    raised on it or marked it failed (``page._arbox_failed``, set by
+    arbox_actions) — in that case the login is always re-checked.
+
+    Usage:
+        session = ArboxSession()
+        await session.start()                       # optional warm-up
+        msg = await session.register(target, "07:00")
+        async with session.page() as page:          # anything else
+            ...
+        await session.close()
+    """
+
+    def __init__(self, headless: bool = True) -> None:
+        self._headless = headless
+        self._lock = asyncio.Lock()
+        self._stack: AsyncExitStack | None = None
+        self._page: Page | None = None
+        self._opened_at = 0.0
+        # Set when the last page was dropped after a failure: the next open
+        # probes the login instead of trusting a recently confirmed one.
+        self._verify_next = False
+
+    async def _open(self) -> Page:
+        if self._page is not None and time.time() - self._opened_at > config.SESSION_MAX_AGE:
+            logger.info("Shared Arbox page is stale — reopening.")
+            await self._discard()
+        if self._page is None:
+            stack = AsyncExitStack()
+            self._page = await stack.enter_async_context(
+                arbox_page(headless=self._headless, verify_session=self._verify_next)
+            )
+            self._stack = stack
+            self._opened_at = time.time()
+            self._verify_next = False
+        return self._page
+
+    async def _discard(self) -> None:
+        stack, self._stack, self._page = self._stack, None, None
+        if stack is not None:
+            try:
+                await stack.aclose()
+            except Exception:
+                logger.exception("Closing the shared Arbox page failed")
+
+    async def start(self) -> None:
+        """Open and log in ahead of the first command."""
+        async with self._lock:
+            await self._open()
+
+    async def close(self) -> None:
+        async with self._lock:
+            await self._discard()
+
+    @asynccontextmanager
+    async def page(self):
+        """Async context manager — yields the shared page for exclusive use."""
+        async with self._lock:
+            page = await self._open()
+            try:
+                yield page
+            except Exception:
+                self._verify_next = True
+                await self._discard()
+                raise
+            if getattr(page, "_arbox_failed", False):
+                logger.info("Shared Arbox page marked failed — reopening on next use.")
+                self._verify_next = True
+                await self._discard()
+
+    async def register(self, target: date, time_str: str) -> str:
+        async with self.page() as page:
+            return await register_class(page, target, time_str)
+
+    async def cancel(self, target: date, time_str: str) -> str:
+        async with self.page() as page:
+            return await cancel_class(page, target, time_str)
+
+    async def list_registered(self) -> list[dict]:
+        async with self.page() as page:
+            return await get_registered_classes(page)
+
+    async def available_slots(self, target: date) -> list[str]:
+        async with self.page() as page:
+            return await get_available_slots(page, target)
@@ -0,0 +1,38 @@
+"""
+Shared Telegram Bot for outgoing messages sent outside a handler.
+
+The scheduled registration job and the WOD sender both push messages to
+the configured chat.  Building a Bot for each send means a fresh httpx
+client and a new TLS handshake to api.telegram.org every time; get_bot()
+hands out one lazily-built instance instead, so its connection pool and
+keep-alive are reused.
+"""
+
+from __future__ import annotations
+
+from telegram import Bot
+from telegram.request import HTTPXRequest
+
+import config
+
+_bot: Bot | None = None
+# Kept so close_bot() can shut the pool down itself: Bot.shutdown() is a
+# no-op unless the Bot was initialize()d, which get_bot() doesn't do.
+_request: HTTPXRequest | None = None
+
+
+def get_bot() -> Bot:
+    """Return the process-wide Bot, creating it on first use."""
+    global _bot, _request
+    if _bot is None:
+        _request = HTTPXRequest(connection_pool_size=8, read_timeout=30)
+        _bot = Bot(token=config.TELEGRAM_TOKEN, request=_request)
+    return _bot
+
+
+async def close_bot() -> None:
+    """Close the shared Bot's connection pool, if one was created."""
+    global _bot, _request
+    request, _bot, _request = _request, None, None
+    if request is not None:
+        await request.shutdown()
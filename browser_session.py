@@ -17,19 +17,43 @@ Session validity:
 
 from __future__ import annotations
 
+import asyncio
 import logging
+import time
 from contextlib import asynccontextmanager
+from datetime import datetime, timedelta
 from pathlib import Path
 
-from playwright.async_api import async_playwright, BrowserContext, Page
+import pytz
+from playwright.async_api import async_playwright, Browser, BrowserContext, Page, Playwright
 
 import config
 
 SESSION_FILE = Path("arbox_session.json")
+# Touched only when a login succeeds or the validity probe passes.  Its mtime
+# is the age of the last confirmed login — SESSION_FILE itself is rewritten
+# every time a context closes, so its mtime only says when it was last used.
+SESSION_VERIFIED_FILE = Path("arbox_session.verified")
 logger = logging.getLogger(__name__)
+TZ = pytz.timezone(config.TIMEZONE)
 
 # Large viewport so the Arbox login modal is never clipped outside the screen.
 _VIEWPORT = {"width": 1440, "height": 900}
+# Arbox contexts run on Israel time so the week the schedule opens on matches
+# the one recorded in _wait_for_arbox_frame, whatever the host's timezone.
+_ARBOX_CONTEXT = {"viewport": _VIEWPORT, "timezone_id": config.TIMEZONE}
+
+
+def _mark_session_verified() -> None:
+    SESSION_VERIFIED_FILE.touch()
+
+
+def _session_verified_age() -> float:
+    """Seconds since the login was last confirmed (inf if never)."""
+    try:
+        return time.time() - SESSION_VERIFIED_FILE.stat().st_mtime
+    except OSError:
+        return float("inf")
 
 
 async def _navigate_to_schedule(page: Page) -> None:
@@ -38,7 +62,15 @@ async def _navigate_to_schedule(page: Page) -> None:
       1. Main site
       2. Click "סניף סירקין" in the navigation bar
       3. Click "מערכת שעות" link
+
+    Any schedule frame, week index and displayed week memoized on the page by
+    arbox_actions are dropped, since the navigation replaces them, and so is
+    its failure mark.
     """
+    page._arbox_frame = None
+    page._arbox_week_index = None
+    page._arbox_shown_week = None
+    page._arbox_failed = False
     await page.goto("https://www.crossfitpanda.com/", wait_until="load")
     await page.get_by_role("navigation").get_by_role("link", name="סניף סירקין").click()
     await page.wait_for_load_state("load")
@@ -46,6 +78,36 @@ async def _navigate_to_schedule(page: Page) -> None:
     await page.wait_for_load_state("load")
 
 
+async def _wait_for_arbox_frame(page: Page, timeout: float = 10.0):
+    """
+    Return the arboxapp.com schedule frame as soon as it has rendered.
+
+    Polls page.frames every 100 ms for the arboxapp.com entry (frames[0] is
+    the host page itself), then waits for the first day column inside it.
+    The frame is memoized on the page for arbox_actions._get_frame, and the
+    week the schedule opened on (the Sunday of the current week, as of now)
+    as ``page._arbox_shown_week`` — a page kept open across midnight still
+    shows the week it was loaded on, so that can't be worked out later.
+    Raises TimeoutError if nothing shows up within *timeout* seconds.
+    """
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + timeout
+    while True:
+        for f in page.frames[1:]:
+            if "arboxapp.com" in f.url:
+                remaining_ms = max(deadline - loop.time(), 0.1) * 1000
+                await f.locator(".date-events-wrapper").first.wait_for(
+                    state="visible", timeout=remaining_ms
+                )
+                page._arbox_frame = f
+                today = datetime.now(TZ).date()
+                page._arbox_shown_week = today - timedelta(days=(today.weekday() + 1) % 7)
+                return f
+        if loop.time() >= deadline:
+            raise TimeoutError("arboxapp.com schedule frame did not load.")
+        await asyncio.sleep(0.1)
+
+
 async def _do_login(page: Page) -> None:
     """
     Full login sequence — exact match of the recorded Playwright script:
@@ -70,14 +132,17 @@ async def _do_login(page: Page) -> None:
     # This is necessary because the Arbox login modal can render outside
     # the iframe's visible bounds regardless of the page viewport size.
 
+    login_btn = frame.get_by_role("button", name="כניסה")
+    email_input = frame.locator('input[type="email"]')
+
     # Step 1 — open the login form
-    await frame.get_by_role("button", name="כניסה").dispatch_event("click")
+    await login_btn.dispatch_event("click")
     await frame.get_by_role("button", name="כניסה עם שם משתמש וסיסמה").dispatch_event("click")
 
     # Step 2 — fill credentials (Tab after email activates the password field)
-    await frame.locator('input[type="email"]').dispatch_event("click")
-    await frame.locator('input[type="email"]').fill(config.BOT_EMAIL)
-    await frame.locator('input[type="email"]').press("Tab")
+    await email_input.dispatch_event("click")
+    await email_input.fill(config.BOT_EMAIL)
+    await email_input.press("Tab")
     await frame.locator('input[type="password"]').fill(config.BOT_PASSWORD)
 
     # Step 3 — submit
@@ -88,9 +153,8 @@ async def _do_login(page: Page) -> None:
     # Wait until the main login button disappears (= login succeeded).
     # Use .first to avoid strict-mode violation: after the dialog opens,
     # multiple elements share the role+name "כניסה" (main btn, dialog btn, code btn).
-    await frame.get_by_role("button", name="כניסה").first.wait_for(
-        state="hidden", timeout=15_000
-    )
+    await login_btn.first.wait_for(state="hidden", timeout=15_000)
+    _mark_session_verified()
     logger.info("Login successful.")
 
 
@@ -103,20 +167,14 @@ async def _session_is_valid(context: BrowserContext) -> bool:
     page = await context.new_page()
     try:
         await _navigate_to_schedule(page)
-        await page.wait_for_timeout(5_000)   # wait for arboxapp.com iframe to load
 
         # Find the arboxapp.com frame directly — frame_locator("iframe").first
         # is unreliable when multiple iframes are present on the page.
-        arbox_frame = None
-        for f in page.frames[1:]:
-            if "arboxapp.com" in f.url:
-                arbox_frame = f
-                break
-
-        if arbox_frame is None:
-            return False
+        arbox_frame = await _wait_for_arbox_frame(page)
 
         login_btn_visible = await arbox_frame.get_by_role("button", name="כניסה").first.is_visible()
+        if not login_btn_visible:
+            _mark_session_verified()
         return not login_btn_visible
     except Exception:
         return False
@@ -124,23 +182,74 @@ async def _session_is_valid(context: BrowserContext) -> bool:
         await page.close()
 
 
+# ── Shared browser ────────────────────────────────────────────────────────────
+# A long-running process (the Telegram bot) calls start_browser() once so every
+# arbox_page()/browser_page() opens a new context on the same Chromium instead
+# of launching one.  One-shot runs skip it and get a private browser per call.
+
+_playwright: Playwright | None = None
+_browser: Browser | None = None
+
+
+async def start_browser() -> None:
+    """Launch the shared headless browser (no-op if already running)."""
+    global _playwright, _browser
+    if _browser is not None and _browser.is_connected():
+        return
+    if _playwright is None:
+        _playwright = await async_playwright().start()
+    _browser = await _playwright.chromium.launch(headless=True)
+    logger.info("Shared browser launched.")
+
+
+async def stop_browser() -> None:
+    """Close the shared browser and stop Playwright."""
+    global _playwright, _browser
+    browser, _browser = _browser, None
+    pw, _playwright = _playwright, None
+    if browser is not None:
+        await browser.close()
+    if pw is not None:
+        await pw.stop()
+
+
+@asynccontextmanager
+async def _browser_for(headless: bool):
+    """
+    Yield the shared browser if it is running and matches *headless*;
+    otherwise launch a private one for the duration of the block.
+    """
+    if headless and _browser is not None and _browser.is_connected():
+        yield _browser
+        return
+    async with async_playwright() as p:
+        browser = await p.chromium.launch(headless=headless)
+        try:
+            yield browser
+        finally:
+            await browser.close()
+
+
 # ── Public context manager ────────────────────────────────────────────────────
 
 @asynccontextmanager
-async def arbox_page(headless: bool = True):
+async def arbox_page(headless: bool = True, verify_session: bool = False):
     """
     Async context manager — yields an authenticated Playwright Page.
 
     The page is positioned at STUDIO_URL with the schedule iframe loaded.
     Pass headless=False to watch the browser (useful when debugging selectors).
 
+    A cached session whose login was confirmed (fresh login or passed
+    validity probe) less than config.SESSION_MAX_AGE seconds ago is trusted
+    without the probe.  Pass verify_session=True to always probe it.
+
     Usage:
         async with arbox_page() as page:
             frame = page.frame_locator("iframe").first
             ...
     """
-    async with async_playwright() as p:
-        browser = await p.chromium.launch(headless=headless)
+    async with _browser_for(headless) as browser:
         context: BrowserContext | None = None
 
         # ── 1. Try cached session ──────────────────────────────────────────
@@ -148,32 +257,101 @@ async def arbox_page(headless: bool = True):
             logger.info("Trying cached Arbox session…")
             context = await browser.new_context(
                 storage_state=str(SESSION_FILE),
-                viewport=_VIEWPORT,
+                **_ARBOX_CONTEXT,
             )
-            if not await _session_is_valid(context):
+            session_age = _session_verified_age()
+            if not verify_session and session_age < config.SESSION_MAX_AGE:
+                logger.info("Login confirmed %d s ago — skipping validity check.", session_age)
+            elif not await _session_is_valid(context):
                 logger.info("Cached session expired — will re-login.")
                 await context.close()
                 context = None
 
-        # ── 2. Fresh login if needed ───────────────────────────────────────
-        if context is None:
-            context = await browser.new_context(viewport=_VIEWPORT)
-            page = await context.new_page()
-            await _do_login(page)
-            await page.wait_for_timeout(3_000)   # let schedule iframe fully render
-            await context.storage_state(path=str(SESSION_FILE))
-            logger.info("Session cached at %s", SESSION_FILE)
-        else:
-            page = await context.new_page()
-            await _navigate_to_schedule(page)
-            await page.wait_for_timeout(3_000)   # let schedule iframe fully render
-
-        # ── 3. Yield the ready page ────────────────────────────────────────
         try:
-            yield page
-        finally:
-            try:
+            # ── 2. Fresh login if needed ───────────────────────────────────
+            if context is None:
+                context = await browser.new_context(**_ARBOX_CONTEXT)
+                page = await context.new_page()
+                await _do_login(page)
+                await _wait_for_arbox_frame(page)
                 await context.storage_state(path=str(SESSION_FILE))
-            except Exception:
-                pass
-            await browser.close()
+                logger.info("Session cached at %s", SESSION_FILE)
+            else:
+                page = await context.new_page()
+                await _navigate_to_schedule(page)
+                await _wait_for_arbox_frame(page)
+
+            # ── 3. Yield the ready page ────────────────────────────────────
+            try:
+                yield page
+            finally:
+                try:
+                    await context.storage_state(path=str(SESSION_FILE))
+                except Exception:
+                    pass
+        finally:
+            # Only the context — the browser may be the shared one.
+            if context is not None:
+                await context.close()
+
+
+@asynccontextmanager
+async def browser_page(headless: bool = True):
+    """
+    Async context manager — yields a blank Page (no Arbox login) in its own
+    BrowserContext, on the shared browser when one is running.
+    """
+    async with _browser_for(headless) as browser:
+        context = await browser.new_context()
+        try:
+            yield await context.new_page()
+        finally:
+            await context.close()
+
+
+async def _open_sibling(browser: Browser, state: dict) -> tuple[BrowserContext, Page]:
+    """Open one extra context seeded with *state*; closes it again on failure."""
+    context = await browser.new_context(storage_state=state, **_ARBOX_CONTEXT)
+    try:
+        page = await context.new_page()
+        await _navigate_to_schedule(page)
+        await _wait_for_arbox_frame(page)
+    except BaseException:
+        await context.close()
+        raise
+    return context, page
+
+
+@asynccontextmanager
+async def extra_pages(page: Page, count: int):
+    """
+    Async context manager — yields up to *count* additional authenticated Pages.
+
+    Each page lives in its own BrowserContext on the same browser as *page*,
+    seeded with *page*'s cookies/storage, and has the schedule iframe loaded.
+    Used to run independent schedule actions in parallel.  Siblings that fail
+    to open are logged and left out, so the list may be shorter than *count*
+    (or empty) — callers fall back to fewer pages.  The contexts are closed
+    on exit; *page* itself is left untouched.
+    """
+    opened: list[tuple[BrowserContext, Page]] = []
+    if count > 0:
+        try:
+            state = await page.context.storage_state()
+            results = await asyncio.gather(
+                *(_open_sibling(page.context.browser, state) for _ in range(count)),
+                return_exceptions=True,
+            )
+        except Exception:
+            logger.exception("Could not open extra Arbox pages")
+            results = []
+        opened = [r for r in results if not isinstance(r, BaseException)]
+        for r in results:
+            if isinstance(r, BaseException):
+                logger.warning("Extra Arbox page failed to open: %r", r)
+
+    try:
+        yield [p for _, p in opened]
+    finally:
+        for context, _ in opened:
+            await context.close()
@@ -17,17 +17,33 @@ BOT_EMAIL    = os.getenv("BOT_EMAIL")
 BOT_PASSWORD = os.getenv("BOT_PASSWORD")
 STUDIO_URL   = os.getenv("STUDIO_URL")   # e.g. https://www.crossfitpanda.com/sirkin
 
+# ── Browser session ───────────────────────────────────────────────────────────
+# A cached Arbox session younger than this (seconds) is reused without first
+# checking that it is still logged in.  Arbox sessions last for hours.
+SESSION_MAX_AGE = int(os.getenv("SESSION_MAX_AGE", "1800"))
+
 # ── WOD scraper ───────────────────────────────────────────────────────────────
 WOD_SITE_URL = "https://www.crossfitpanda.com/"
 
 # ── Timezone ──────────────────────────────────────────────────────────────────
 TIMEZONE = "Asia/Jerusalem"
 
+# ── Scheduler ─────────────────────────────────────────────────────────────────
+# APScheduler job store (SQLAlchemy URL) — keeps the Saturday job across restarts.
+SCHEDULER_DB_URL = os.getenv("SCHEDULER_DB_URL", "sqlite:///scheduler.db")
+
 # ── Class name filter ─────────────────────────────────────────────────────────
 # Some time slots have multiple concurrent classes (e.g. CrossFit WOD + Open GYM).
 # This string is used to pick the right one.  Change if your box names it differently.
 CLASS_NAME = "CrossFit WOD"
 
+# ── Registered-slot marker ────────────────────────────────────────────────────
+# CSS selector that matches a .session-wrapper the user is booked into (find it
+# by comparing a booked and an unbooked slot's outerHTML with
+# arbox_page(headless=False)).  When set, "my classes" is read straight from the
+# schedule in one pass; when None, each slot's modal is opened to check.
+REGISTERED_SLOT_SELECTOR: str | None = None
+
 # ── Weekly batch-registration schedule ───────────────────────────────────────
 # Triggered every Saturday at 21:00 (Israel time).
 # WODs run every day: 07:00, 08:00, 17:00, 18:00, 19:00, 20:00.
@@ -13,6 +13,7 @@ Modes
 
   bookweek  One-shot: register all next-week classes right now, then exit.
             Useful for manual testing of the registration logic.
+            Add --verify-session to re-check a recently cached login.
 
 DEPLOYMENT NOTES
 ----------------
@@ -51,7 +52,7 @@ Usage
 -----
   python main.py wod
   python main.py bot
-  python main.py bookweek
+  python main.py bookweek [--verify-session]
 """
 
 import asyncio
@@ -66,8 +67,17 @@ def main() -> None:
     mode = sys.argv[1].lower()
 
     if mode == "wod":
-        from wod_bot import WodBot
-        asyncio.run(WodBot().fetch_and_send())
+        async def _run():
+            from bot_client import close_bot
+            from browser_session import browser_page
+            from wod_bot import WodBot
+            try:
+                async with browser_page() as page:
+                    await WodBot().fetch_and_send(page)
+            finally:
+                await close_bot()
+
+        asyncio.run(_run())
 
     elif mode == "bot":
         # run_bot() manages its own event loop via Application.run_polling().
@@ -78,7 +88,8 @@ def main() -> None:
         async def _run():
             from arbox_actions import batch_register_next_week
             from browser_session import arbox_page
-            async with arbox_page() as page:
+            verify = "--verify-session" in sys.argv[2:]
+            async with arbox_page(verify_session=verify) as page:
                 results = await batch_register_next_week(page)
             for msg in results:
                 print(msg)
@@ -1,40 +1,187 @@
 """
 Persistent registration queue.
 
-Stores pending registration requests in a JSON file so they survive
-bot restarts.  The queue is drained at Saturday 21:00 when Arbox
+Stores pending registration requests in an append-only log so they
+survive bot restarts.  The queue is drained at Saturday 21:00 when Arbox
 opens next-week registration.
 
-File format (registration_queue.json):
-    [
-        {"date": "2025-03-02", "time": "07:00"},
-        ...
-    ]
+File format (registration_queue.jsonl), one operation per line:
+    {"op": "add", "date": "2025-03-02", "time": "07:00"}
+    {"op": "rm",  "date": "2025-03-02", "time": "07:00"}
+
+Each mutation appends a single line instead of rewriting the whole file;
+the queue is rebuilt by replaying the log in order.  Whenever the queue
+becomes empty (clear_queue, or the Saturday drain removing the last
+entry) the log is compacted by atomically replacing it with an empty file.
+A queue left by older versions in registration_queue.json is imported on
+first load.
+
+The replayed list is cached in memory and only re-read when the file's
+modification time changes, so lookups don't hit the disk every time.
+Wrap a run of mutations in ``with queue_batch():`` to append them in a
+single write at the end instead of one write per change.
 """
 
 from __future__ import annotations
 
-import json
+import os
+import tempfile
+import threading
+from contextlib import contextmanager
 from datetime import date
 from pathlib import Path
 
-QUEUE_FILE = Path("registration_queue.json")
+import orjson
+
+QUEUE_FILE = Path("registration_queue.jsonl")
+_LEGACY_FILE = Path("registration_queue.json")
+
+# In-memory copy of the replayed log and the mtime (ns) it was read at /
+# written with.  _INDEX mirrors _CACHE as a set of (date ISO, time) keys for
+# O(1) lookups; the list is kept for display order.
+_CACHE: list[dict] | None = None
+_INDEX: set[tuple[str, str]] = set()
+_CACHE_MTIME: int = 0
+# Guards read-modify-write sequences on _CACHE.
+_LOCK = threading.RLock()
+# Open queue_batch() blocks, and log lines not yet appended to the file.
+_batch_depth = 0
+_pending: list[bytes] = []
+
+
+def _key(entry: dict) -> tuple[str, str]:
+    return entry["date"], entry["time"]
+
+
+def _set_cache(queue: list[dict]) -> None:
+    """Replace _CACHE with *queue* and rebuild _INDEX from it."""
+    global _CACHE, _INDEX
+    _CACHE = queue
+    _INDEX = {_key(e) for e in queue}
+
+
+def _replay(data: bytes) -> list[dict]:
+    """Rebuild the queue from log lines, applying add/rm in order."""
+    entries: dict[tuple[str, str], dict] = {}
+    for line in data.splitlines():
+        try:
+            rec = orjson.loads(line)
+            key = rec["date"], rec["time"]
+        except (orjson.JSONDecodeError, KeyError, TypeError):
+            continue   # blank line, or a write cut short by a crash
+        if rec.get("op") == "rm":
+            entries.pop(key, None)
+        else:
+            entries.setdefault(key, {"date": key[0], "time": key[1]})
+    return list(entries.values())
+
+
+def _load_legacy() -> list[dict]:
+    """Import (and retire) a queue saved in the old single-JSON format."""
+    try:
+        queue = orjson.loads(_LEGACY_FILE.read_bytes())
+    except (orjson.JSONDecodeError, OSError):
+        return []
+    _save(queue)
+    _LEGACY_FILE.unlink(missing_ok=True)
+    return queue
 
 
 def _load() -> list[dict]:
-    if not QUEUE_FILE.exists():
-        return []
+    """
+    Return the cached queue, replaying the log only if it changed on disk.
+
+    The cache is authoritative once anything was loaded or written, and
+    while queue_batch() has lines not yet appended: a missing file (nothing
+    flushed yet) must not wipe changes that only exist in memory.
+    """
+    global _CACHE_MTIME
+    if _CACHE is not None and _pending:
+        return _CACHE
     try:
-        return json.loads(QUEUE_FILE.read_text(encoding="utf-8"))
-    except (json.JSONDecodeError, OSError):
-        return []
+        mtime = QUEUE_FILE.stat().st_mtime_ns
+    except OSError:
+        if _CACHE is not None:
+            return _CACHE
+        if _LEGACY_FILE.exists():
+            _set_cache(_load_legacy())
+            return _CACHE
+        _set_cache([])
+        _CACHE_MTIME = 0
+        return _CACHE
+    if _CACHE is not None and mtime == _CACHE_MTIME:
+        return _CACHE
+    try:
+        _set_cache(_replay(QUEUE_FILE.read_bytes()))
+    except OSError:
+        _set_cache([])
+    _CACHE_MTIME = mtime
+    return _CACHE
 
 
 def _save(queue: list[dict]) -> None:
-    QUEUE_FILE.write_text(
-        json.dumps(queue, ensure_ascii=False, indent=2),
-        encoding="utf-8",
+    """
+    Compact the log: write *queue* as one "add" line per entry to a temp
+    file next to QUEUE_FILE, then os.replace() it over the original, so a
+    crash mid-write can never leave a truncated log behind.
+    """
+    global _CACHE_MTIME
+    payload = b"".join(
+        orjson.dumps({"op": "add", **e}) + b"\n" for e in queue
     )
+    with tempfile.NamedTemporaryFile(
+        "wb", dir=QUEUE_FILE.parent,
+        prefix=QUEUE_FILE.name, suffix=".tmp", delete=False,
+    ) as tmp:
+        tmp.write(payload)
+    try:
+        os.replace(tmp.name, QUEUE_FILE)
+    except OSError:
+        os.unlink(tmp.name)
+        raise
+    if queue is not _CACHE:
+        _set_cache(queue)
+    _pending.clear()
+    _CACHE_MTIME = QUEUE_FILE.stat().st_mtime_ns
+
+
+def _flush() -> None:
+    """Append the pending log lines in one write, or compact if now empty."""
+    global _CACHE_MTIME
+    if not _pending:
+        return
+    if not _CACHE:
+        _save([])
+        return
+    with QUEUE_FILE.open("ab") as fh:
+        fh.write(b"".join(_pending))
+    _pending.clear()
+    _CACHE_MTIME = QUEUE_FILE.stat().st_mtime_ns
+
+
+def _log(op: str, entry: dict) -> None:
+    """Record one mutation; written now, or at the end of queue_batch()."""
+    _pending.append(orjson.dumps({"op": op, **entry}) + b"\n")
+    if not _batch_depth:
+        _flush()
+
+
+@contextmanager
+def queue_batch():
+    """
+    Defer queue writes until the outermost ``with queue_batch():`` exits,
+    then append everything that changed in a single write.
+    """
+    global _batch_depth
+    with _LOCK:
+        _batch_depth += 1
+    try:
+        yield
+    finally:
+        with _LOCK:
+            _batch_depth -= 1
+            if _batch_depth == 0:
+                _flush()
 
 
 def add_to_queue(target_date: date, time_str: str) -> bool:
@@ -42,12 +189,15 @@ def add_to_queue(target_date: date, time_str: str) -> bool:
     Add a registration request to the queue.
     Returns True if added, False if already present.
     """
-    queue = _load()
     entry = {"date": target_date.isoformat(), "time": time_str}
-    if entry in queue:
-        return False
-    queue.append(entry)
-    _save(queue)
+    key = _key(entry)
+    with _LOCK:
+        queue = _load()
+        if key in _INDEX:
+            return False
+        queue.append(entry)
+        _INDEX.add(key)
+        _log("add", entry)
     return True
 
 
@@ -57,21 +207,26 @@ def get_queue() -> list[dict]:
         {"date": date, "time": str}
     Dates are parsed from ISO strings back to date objects.
     """
-    raw = _load()
-    return [{"date": date.fromisoformat(r["date"]), "time": r["time"]} for r in raw]
+    with _LOCK:
+        raw = _load()
+        return [{"date": date.fromisoformat(r["date"]), "time": r["time"]} for r in raw]
 
 
 def remove_from_queue(target_date: date, time_str: str) -> bool:
     """Remove a specific entry.  Returns True if it was present."""
-    queue = _load()
     entry = {"date": target_date.isoformat(), "time": time_str}
-    if entry not in queue:
-        return False
-    queue.remove(entry)
-    _save(queue)
+    key = _key(entry)
+    with _LOCK:
+        queue = _load()
+        if key not in _INDEX:
+            return False
+        queue.remove(entry)
+        _INDEX.discard(key)
+        _log("rm", entry)
     return True
 
 
 def clear_queue() -> None:
-    """Remove all entries from the queue."""
-    _save([])
+    """Remove all entries from the queue and compact the log."""
+    with _LOCK:
+        _save([])
@@ -12,6 +12,13 @@ Scheduling
 Every Saturday at 21:00 Israel time the bot automatically registers you for
 all classes listed in config.WEEKLY_CLASSES.
 
+Browser
+-------
+One Chromium process is launched at startup and shared by everything the bot
+does.  A single logged-in Arbox page (arbox_session.ArboxSession) is opened
+on it in the background and shared, one command at a time, by all handlers;
+/wod scrapes in its own short-lived context on the same browser.
+
 Running
 -------
     python main.py bot
@@ -20,17 +27,23 @@ Running
 from __future__ import annotations
 
 import asyncio
+import functools
 import logging
 import re
+import time
+from collections import defaultdict
+from collections.abc import Awaitable, Callable
 from datetime import date, datetime, timedelta
+from types import MappingProxyType
 
 import pytz
+from apscheduler.jobstores.sqlalchemy import SQLAlchemyJobStore
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from apscheduler.triggers.cron import CronTrigger
 from telegram import (
-    Bot,
     InlineKeyboardButton,
     InlineKeyboardMarkup,
+    Message,
     ReplyKeyboardMarkup,
     Update,
 )
@@ -44,15 +57,11 @@ from telegram.ext import (
 )
 
 import config
-from arbox_actions import (
-    batch_register_next_week,
-    cancel_class,
-    get_available_slots,
-    get_registered_classes,
-    register_class,
-)
-from browser_session import arbox_page
-from queue_manager import add_to_queue, clear_queue, get_queue
+from arbox_actions import batch_register_next_week, register_many
+from arbox_session import ArboxSession
+from bot_client import close_bot, get_bot
+from browser_session import browser_page, start_browser, stop_browser
+from queue_manager import add_to_queue, get_queue, queue_batch, remove_from_queue
 from wod_bot import WodBot
 
 logging.basicConfig(
@@ -62,12 +71,40 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 TZ = pytz.timezone(config.TIMEZONE)
 
+# One logged-in Arbox page shared by every handler and the scheduled job;
+# opened in the background at startup (see run_bot) and reused afterwards.
+_session = ArboxSession()
+
 
-def _this_saturday() -> date:
+def _this_saturday(today: date | None = None) -> date:
     """Return the date of this week's Saturday (Arbox week boundary)."""
-    today = datetime.now(TZ).date()
+    if today is None:
+        today = datetime.now(TZ).date()
     return today + timedelta(days=(5 - today.weekday()) % 7)
 
+
+# The register-or-queue boundary only moves at midnight, so it is kept here
+# and refreshed by a daily scheduler job (see run_bot) instead of being
+# recomputed on every tap.
+_THIS_SATURDAY: date = _this_saturday()
+
+
+def _refresh_saturday(today: date | None = None) -> None:
+    global _THIS_SATURDAY
+    _THIS_SATURDAY = _this_saturday(today)
+
+
+def _saturday_for(today: date) -> date:
+    """
+    _THIS_SATURDAY as seen from the caller's *today*.  Refreshes it first if
+    *today* is already past it (a tap landing before the midnight job ran),
+    so the boundary never disagrees with the caller's own clock read.
+    """
+    if today > _THIS_SATURDAY:
+        _refresh_saturday(today)
+    return _THIS_SATURDAY
+
+
 # ── Persistent reply keyboard (always visible at the bottom) ──────────────────
 
 MAIN_KEYBOARD = ReplyKeyboardMarkup(
@@ -93,7 +130,7 @@ _WEEK_DAYS = [
     ("שבת",   "saturday"),
 ]
 
-def _days_keyboard(action: str) -> InlineKeyboardMarkup:
+def _build_days_keyboard(action: str) -> InlineKeyboardMarkup:
     """
     Day-selection inline keyboard.
     action = "reg" (register) or "can" (cancel)
@@ -117,6 +154,18 @@ def _days_keyboard(action: str) -> InlineKeyboardMarkup:
     return InlineKeyboardMarkup(rows)
 
 
+# The day keyboards never change — build them once.  Markup objects are
+# immutable and serialized on every send, so sharing them is safe.
+_DAYS_KB: dict[str, InlineKeyboardMarkup] = {
+    action: _build_days_keyboard(action) for action in ("reg", "can")
+}
+
+
+def _days_keyboard(action: str) -> InlineKeyboardMarkup:
+    """Return the prebuilt day-selection keyboard for *action* ("reg" / "can")."""
+    return _DAYS_KB[action]
+
+
 def _dynamic_times_keyboard(action: str, day: str, times: list[str]) -> InlineKeyboardMarkup:
     """
     Time-selection inline keyboard built from the live Arbox schedule.
@@ -137,48 +186,54 @@ def _dynamic_times_keyboard(action: str, day: str, times: list[str]) -> InlineKe
 
 # ── Date / time parsing ───────────────────────────────────────────────────────
 
-_DAY_NAME_TO_WEEKDAY: dict[str, int] = {
+_DAY_NAME_TO_WEEKDAY = MappingProxyType({
     "monday": 0, "tuesday": 1, "wednesday": 2, "thursday": 3,
     "friday": 4, "saturday": 5, "sunday": 6,
     "שני": 0, "שלישי": 1, "רביעי": 2, "חמישי": 3,
     "שישי": 4, "שבת": 5, "ראשון": 6,
-}
+})
+
+# Accepted time formats, tried in order: "7:00" / "7:30pm", "7pm", "700" / "0700"
+_RE_HM      = re.compile(r"(?P<h>\d{1,2}):(?P<m>\d{2})(?P<mer>am|pm)?")
+_RE_H       = re.compile(r"(?P<h>\d{1,2})(?P<mer>am|pm)")
+_RE_COMPACT = re.compile(r"\d{3,4}")
 
 
 def _parse_time(token: str) -> str | None:
     t = token.strip().lower()
-    m = re.fullmatch(r"(\d{1,2}):(\d{2})(am|pm)?", t)
+    m = _RE_HM.fullmatch(t)
     if m:
-        h, mn, mer = int(m.group(1)), int(m.group(2)), m.group(3)
+        h, mn, mer = int(m["h"]), int(m["m"]), m["mer"]
         if mer == "pm" and h < 12:
             h += 12
         elif mer == "am" and h == 12:
             h = 0
         return f"{h:02d}:{mn:02d}"
-    m = re.fullmatch(r"(\d{1,2})(am|pm)", t)
+    m = _RE_H.fullmatch(t)
     if m:
-        h, mer = int(m.group(1)), m.group(2)
+        h, mer = int(m["h"]), m["mer"]
         if mer == "pm" and h < 12:
             h += 12
         elif mer == "am" and h == 12:
             h = 0
         return f"{h:02d}:00"
-    m = re.fullmatch(r"(\d{3,4})", t)
+    m = _RE_COMPACT.fullmatch(t)
     if m:
-        raw = m.group(1).zfill(4)
+        raw = m.group(0).zfill(4)
         return f"{raw[:2]}:{raw[2:]}"
     return None
 
 
-def _parse_day(token: str) -> date | None:
+def _parse_day(token: str, today: date | None = None) -> date | None:
     t = token.strip().lower()
-    today = datetime.now(TZ).date()
+    if today is None:
+        today = datetime.now(TZ).date()
     if t in ("today", "היום"):
         return today
     if t in ("tomorrow", "מחר"):
         return today + timedelta(days=1)
-    if t in _DAY_NAME_TO_WEEKDAY:
-        wd = _DAY_NAME_TO_WEEKDAY[t]
+    wd = _DAY_NAME_TO_WEEKDAY.get(t)
+    if wd is not None:
         delta = (wd - today.weekday()) % 7
         if delta == 0:
             delta = 7
@@ -186,18 +241,85 @@ def _parse_day(token: str) -> date | None:
     return None
 
 
-def _parse_class_args(args: list[str]) -> tuple[date, str] | None:
+def _parse_class_args(args: list[str], today: date | None = None) -> tuple[date, str] | None:
     if len(args) < 2:
         return None
-    target_date = _parse_day(args[0])
+    target_date = _parse_day(args[0], today)
     time_str = _parse_time(args[1])
     if target_date is None or time_str is None:
         return None
     return target_date, time_str
 
 
+# ── Per-chat ordering ─────────────────────────────────────────────────────────
+# Updates are processed concurrently (see run_bot) so a slow Playwright action
+# in one chat doesn't hold up the others.  Within a chat, handlers still run
+# one at a time, in arrival order.
+
+_chat_locks: defaultdict[int, asyncio.Lock] = defaultdict(asyncio.Lock)
+
+
+def _per_chat(handler):
+    """
+    Wrap *handler* so it runs under its chat's lock.  Callback queries are
+    acknowledged before waiting, so the button spinner stops right away even
+    if the chat is still busy with an earlier tap.
+    """
+    @functools.wraps(handler)
+    async def wrapper(update: Update, ctx: ContextTypes.DEFAULT_TYPE) -> None:
+        if update.callback_query is not None:
+            await update.callback_query.answer()
+        chat_id = update.effective_chat.id if update.effective_chat else 0
+        async with _chat_locks[chat_id]:
+            await handler(update, ctx)
+    return wrapper
+
+
+# ── Available-times cache ─────────────────────────────────────────────────────
+# Scraping a day's schedule is the heaviest thing the bot does, and the same
+# day tends to be opened repeatedly (back-and-forth taps, the Saturday rush).
+# Class times rarely change, so results are reused for a minute.
+
+_SLOTS_TTL = 60.0   # seconds
+_slots_cache: dict[date, tuple[float, list[str]]] = {}
+_slots_lock = asyncio.Lock()
+
+
+async def _cached_slots(target_date: date) -> list[str]:
+    """get_available_slots for *target_date*, cached for _SLOTS_TTL seconds."""
+    hit = _slots_cache.get(target_date)
+    if hit and time.monotonic() - hit[0] < _SLOTS_TTL:
+        return hit[1]
+    async with _slots_lock:
+        # Another tap may have refreshed it while we waited for the lock.
+        hit = _slots_cache.get(target_date)
+        if hit and time.monotonic() - hit[0] < _SLOTS_TTL:
+            return hit[1]
+        times = await _session.available_slots(target_date)
+        _slots_cache[target_date] = (time.monotonic(), times)
+        return times
+
+
 # ── Inline keyboard callback handler ─────────────────────────────────────────
 
+async def _with_spinner(query, placeholder: str, coro, timeout: float = 0.4) -> None:
+    """
+    Await *coro* and put its result in the inline message.
+
+    *coro* resolves to the final text, or to (text, reply_markup).  The
+    "🔄 ..." *placeholder* is only shown if the result takes longer than
+    *timeout* seconds, so a fast action costs one Telegram edit, not two.
+    """
+    task = asyncio.ensure_future(coro)
+    try:
+        result = await asyncio.wait_for(asyncio.shield(task), timeout)
+    except asyncio.TimeoutError:
+        await query.edit_message_text(placeholder)
+        result = await task
+    text, markup = result if isinstance(result, tuple) else (result, None)
+    await query.edit_message_text(text, reply_markup=markup)
+
+
 async def handle_callback(update: Update, _ctx: ContextTypes.DEFAULT_TYPE) -> None:
     """
     Handle all inline button taps.
@@ -208,9 +330,14 @@ async def handle_callback(update: Update, _ctx: ContextTypes.DEFAULT_TYPE) -> No
       "back|can"             → go back to day selection for cancel
       "{action}|day|{day}"  → day chosen, show time keyboard
       "{action}|{day}|{t}"  → time chosen, execute the action
+
+    The query has already been answered by _per_chat.
     """
     query = update.callback_query
-    await query.answer()
+
+    # One clock read per tap, shared by every date calculation below.
+    today = datetime.now(TZ).date()
+    this_saturday = _saturday_for(today)
 
     data = query.data
     parts = data.split("|")
@@ -224,13 +351,12 @@ async def handle_callback(update: Update, _ctx: ContextTypes.DEFAULT_TYPE) -> No
     if parts[0] == "cancel_direct":
         target_date = date.fromisoformat(parts[1])
         time_str = parts[2]
-        await query.edit_message_text(
-            f"🔄 מבטל... {target_date.strftime('%A %d/%m')} {time_str}"
-        )
         try:
-            async with arbox_page() as page:
-                result = await cancel_class(page, target_date, time_str)
-            await query.edit_message_text(result)
+            await _with_spinner(
+                query,
+                f"🔄 מבטל... {target_date.strftime('%A %d/%m')} {time_str}",
+                _session.cancel(target_date, time_str),
+            )
         except Exception as exc:
             logger.exception("cancel_direct error")
             await query.edit_message_text(f"שגיאה: {exc}")
@@ -251,29 +377,30 @@ async def handle_callback(update: Update, _ctx: ContextTypes.DEFAULT_TYPE) -> No
     # ── Day chosen → fetch live slots, show time keyboard ──
     if parts[1] == "day":
         day = parts[2]
-        target_date = _parse_day(day)
+        target_date = _parse_day(day, today)
         if target_date is None:
             await query.edit_message_text("שגיאה: לא הצלחתי לפענח את היום.")
             return
         label = "רישום" if action == "reg" else "ביטול"
-        await query.edit_message_text(
-            f"🔄 טוען שעות זמינות ל-{target_date.strftime('%A %d/%m')}..."
-        )
-        try:
-            async with arbox_page() as page:
-                times = await get_available_slots(page, target_date)
+
+        async def _times_menu():
+            times = await _cached_slots(target_date)
             if not times:
-                if action == "reg" and target_date > _this_saturday():
+                if action == "reg" and target_date > this_saturday:
                     # Next week's schedule isn't published yet — use default times.
                     times = ["07:00", "08:00", "09:00", "17:00", "18:00", "19:00", "20:00", "21:00"]
                 else:
-                    await query.edit_message_text(
-                        f"אין שיעורי {config.CLASS_NAME} ב-{target_date.strftime('%A %d/%m')}."
-                    )
-                    return
-            await query.edit_message_text(
+                    return f"אין שיעורי {config.CLASS_NAME} ב-{target_date.strftime('%A %d/%m')}."
+            return (
                 f"בחר שעה — {label} {target_date.strftime('%A %d/%m')}:",
-                reply_markup=_dynamic_times_keyboard(action, day, times),
+                _dynamic_times_keyboard(action, day, times),
+            )
+
+        try:
+            await _with_spinner(
+                query,
+                f"🔄 טוען שעות זמינות ל-{target_date.strftime('%A %d/%m')}...",
+                _times_menu(),
             )
         except Exception as exc:
             logger.exception("get_available_slots error")
@@ -282,21 +409,20 @@ async def handle_callback(update: Update, _ctx: ContextTypes.DEFAULT_TYPE) -> No
 
     # ── Time chosen → queue (reg) or execute immediately (can) ──
     day, time_str = parts[1], parts[2]
-    target_date = _parse_day(day)
+    target_date = _parse_day(day, today)
     if target_date is None:
         await query.edit_message_text("שגיאה: לא הצלחתי לפענח את היום.")
         return
 
     if action == "reg":
-        if target_date <= _this_saturday():
+        if target_date <= this_saturday:
             # Current week — registration is open now, execute immediately.
-            await query.edit_message_text(
-                f"🔄 רושם... {target_date.strftime('%A %d/%m')} {time_str}"
-            )
             try:
-                async with arbox_page() as page:
-                    result = await register_class(page, target_date, time_str)
-                await query.edit_message_text(result)
+                await _with_spinner(
+                    query,
+                    f"🔄 רושם... {target_date.strftime('%A %d/%m')} {time_str}",
+                    _session.register(target_date, time_str),
+                )
             except Exception as exc:
                 logger.exception("handle_callback register error")
                 await query.edit_message_text(f"שגיאה: {exc}")
@@ -316,43 +442,17 @@ async def handle_callback(update: Update, _ctx: ContextTypes.DEFAULT_TYPE) -> No
         return
 
     # cancel — execute immediately
-    await query.edit_message_text(
-        f"🔄 מבטל... {target_date.strftime('%A %d/%m')} {time_str}"
-    )
     try:
-        async with arbox_page() as page:
-            result = await cancel_class(page, target_date, time_str)
-        await query.edit_message_text(result)
+        await _with_spinner(
+            query,
+            f"🔄 מבטל... {target_date.strftime('%A %d/%m')} {time_str}",
+            _session.cancel(target_date, time_str),
+        )
     except Exception as exc:
         logger.exception("handle_callback cancel error")
         await query.edit_message_text(f"שגיאה: {exc}")
 
 
-# ── Reply-keyboard text handler ───────────────────────────────────────────────
-
-async def handle_menu_text(update: Update, ctx: ContextTypes.DEFAULT_TYPE) -> None:
-    """Handle taps on the persistent reply keyboard buttons."""
-    text = update.message.text
-
-    if text == "🏋️ WOD היומי":
-        await cmd_wod(update, ctx)
-
-    elif text == "📅 רישום לשיעור":
-        await update.message.reply_text(
-            "בחר יום לרישום:",
-            reply_markup=_days_keyboard("reg"),
-        )
-
-    elif text == "❌ ביטול שיעור":
-        await cmd_cancel_pick(update, ctx)
-
-    elif text == "📊 השיעורים שלי":
-        await cmd_mystatus(update, ctx)
-
-    elif text == "📝 רישומים עתידיים":
-        await cmd_myqueue(update, ctx)
-
-
 # ── Command handlers ──────────────────────────────────────────────────────────
 
 async def cmd_start(update: Update, _ctx: ContextTypes.DEFAULT_TYPE) -> None:
@@ -374,18 +474,33 @@ async def cmd_help(update: Update, ctx: ContextTypes.DEFAULT_TYPE) -> None:
     await cmd_start(update, ctx)
 
 
-async def cmd_wod(update: Update, _ctx: ContextTypes.DEFAULT_TYPE) -> None:
-    await update.message.reply_text("מביא WOD...")
+# Strong references to fire-and-forget tasks so they aren't garbage-collected
+# mid-run; each task removes itself when done.
+_background: set[asyncio.Task] = set()
+
+
+async def _send_wod(message: Message) -> None:
     try:
-        await WodBot().fetch_and_send()
-        await update.message.reply_text("WOD נשלח!")
+        async with browser_page() as page:
+            await WodBot().fetch_and_send(page)
+        await message.reply_text("WOD נשלח!")
     except Exception as exc:
         logger.exception("cmd_wod error")
-        await update.message.reply_text(f"שגיאה: {exc}")
+        await message.reply_text(f"שגיאה: {exc}")
+
+
+async def cmd_wod(update: Update, _ctx: ContextTypes.DEFAULT_TYPE) -> None:
+    # Scraping the WOD site takes a while; run it as a background task so
+    # the chat lock is released and other commands aren't held up meanwhile.
+    task = asyncio.create_task(_send_wod(update.message))
+    _background.add(task)
+    task.add_done_callback(_background.discard)
+    await update.message.reply_text("מביא WOD ברקע…")
 
 
 async def cmd_register(update: Update, ctx: ContextTypes.DEFAULT_TYPE) -> None:
-    parsed = _parse_class_args(ctx.args or [])
+    today = datetime.now(TZ).date()
+    parsed = _parse_class_args(ctx.args or [], today)
     if parsed is None:
         await update.message.reply_text(
             "שימוש: /register <יום> <שעה>\n"
@@ -393,13 +508,12 @@ async def cmd_register(update: Update, ctx: ContextTypes.DEFAULT_TYPE) -> None:
         )
         return
     target_date, time_str = parsed
-    if target_date <= _this_saturday():
+    if target_date <= _saturday_for(today):
         await update.message.reply_text(
             f"🔄 רושם {target_date.strftime('%A %d/%m')} {time_str}..."
         )
         try:
-            async with arbox_page() as page:
-                result = await register_class(page, target_date, time_str)
+            result = await _session.register(target_date, time_str)
             await update.message.reply_text(result)
         except Exception as exc:
             logger.exception("cmd_register error")
@@ -429,8 +543,7 @@ async def cmd_cancel(update: Update, ctx: ContextTypes.DEFAULT_TYPE) -> None:
     target_date, time_str = parsed
     await update.message.reply_text(f"🔄 מבטל {target_date.strftime('%A %d/%m')} {time_str}...")
     try:
-        async with arbox_page() as page:
-            result = await cancel_class(page, target_date, time_str)
+        result = await _session.cancel(target_date, time_str)
         await update.message.reply_text(result)
     except Exception as exc:
         logger.exception("cmd_cancel error")
@@ -440,7 +553,7 @@ async def cmd_cancel(update: Update, ctx: ContextTypes.DEFAULT_TYPE) -> None:
 async def cmd_bookweek(update: Update, _ctx: ContextTypes.DEFAULT_TYPE) -> None:
     await update.message.reply_text("🔄 רושם לכל שיעורי השבוע הבא...")
     try:
-        async with arbox_page() as page:
+        async with _session.page() as page:
             results = await batch_register_next_week(page)
         summary = "\n".join(results) if results else "אין שיעורים מוגדרים ב-config.py."
         await update.message.reply_text(f"סיימתי:\n{summary}")
@@ -453,8 +566,7 @@ async def cmd_cancel_pick(update: Update, _ctx: ContextTypes.DEFAULT_TYPE) -> No
     """Show only registered classes as cancel buttons — no day selection needed."""
     await update.message.reply_text("🔄 טוען שיעורים רשומים...")
     try:
-        async with arbox_page() as page:
-            classes = await get_registered_classes(page)
+        classes = await _session.list_registered()
         if not classes:
             await update.message.reply_text("אין שיעורים רשומים לשבוע הנוכחי.")
             return
@@ -478,19 +590,18 @@ async def cmd_cancel_pick(update: Update, _ctx: ContextTypes.DEFAULT_TYPE) -> No
 async def cmd_mystatus(update: Update, _ctx: ContextTypes.DEFAULT_TYPE) -> None:
     await update.message.reply_text("🔄 סורק שיעורים רשומים... (זה עלול לקחת דקה)")
     try:
-        async with arbox_page() as page:
-            classes = await get_registered_classes(page)
+        classes = await _session.list_registered()
 
         if not classes:
             await update.message.reply_text("אין שיעורים רשומים לשבוע הנוכחי.")
             return
 
-        lines = ["📊 *השיעורים שלי — שבוע נוכחי:*\n"]
-        for c in classes:
-            date_str = c["date"].strftime("%A %d/%m")
-            lines.append(f"✅ {date_str} | {c['time']}")
-
-        await update.message.reply_text("\n".join(lines), parse_mode="Markdown")
+        body = "\n".join(
+            f"✅ {c['date'].strftime('%A %d/%m')} | {c['time']}" for c in classes
+        )
+        await update.message.reply_text(
+            f"📊 *השיעורים שלי — שבוע נוכחי:*\n\n{body}", parse_mode="Markdown"
+        )
     except Exception as exc:
         logger.exception("cmd_mystatus error")
         await update.message.reply_text(f"שגיאה: {exc}")
@@ -501,30 +612,62 @@ async def cmd_myqueue(update: Update, _ctx: ContextTypes.DEFAULT_TYPE) -> None:
     if not queue:
         await update.message.reply_text("התור ריק — אין רישומים ממתינים לשבת.")
         return
-    lines = ["📝 *רישומים ממתינים לשבת 21:00:*\n"]
-    for item in queue:
-        lines.append(f"⏳ {item['date'].strftime('%A %d/%m')} | {item['time']}")
-    await update.message.reply_text("\n".join(lines), parse_mode="Markdown")
+    body = "\n".join(
+        f"⏳ {item['date'].strftime('%A %d/%m')} | {item['time']}" for item in queue
+    )
+    await update.message.reply_text(
+        f"📝 *רישומים ממתינים לשבת 21:00:*\n\n{body}", parse_mode="Markdown"
+    )
+
+
+# ── Reply-keyboard text handler ───────────────────────────────────────────────
+
+async def _send_reg_days(update: Update, _ctx: ContextTypes.DEFAULT_TYPE) -> None:
+    await update.message.reply_text(
+        "בחר יום לרישום:",
+        reply_markup=_days_keyboard("reg"),
+    )
+
+
+# Button text → handler for the persistent reply keyboard.
+_MENU: dict[str, Callable[[Update, ContextTypes.DEFAULT_TYPE], Awaitable[None]]] = {
+    "🏋️ WOD היומי": cmd_wod,
+    "📅 רישום לשיעור": _send_reg_days,
+    "❌ ביטול שיעור": cmd_cancel_pick,
+    "📊 השיעורים שלי": cmd_mystatus,
+    "📝 רישומים עתידיים": cmd_myqueue,
+}
+
+
+async def handle_menu_text(update: Update, ctx: ContextTypes.DEFAULT_TYPE) -> None:
+    """Handle taps on the persistent reply keyboard buttons."""
+    handler = _MENU.get(update.message.text)
+    if handler:
+        await handler(update, ctx)
 
 
 # ── Scheduled job (Saturday 21:00 Israel time) ────────────────────────────────
 
 async def _scheduled_batch_register() -> None:
     logger.info("Scheduled weekly batch registration triggered.")
-    bot = Bot(token=config.TELEGRAM_TOKEN)
+    bot = get_bot()
     all_results: list[str] = []
     try:
-        async with arbox_page() as page:
+        async with _session.page() as page:
             # 1. Drain the manual queue first
+            #    Registrations run in parallel browser contexts.  Each drained
+            #    entry is then removed individually (entries queued meanwhile
+            #    survive); queue_batch() writes the file once.
             queued = get_queue()
             if queued:
                 logger.info("Draining %d queued registration(s).", len(queued))
-                for item in queued:
-                    msg = await register_class(page, item["date"], item["time"])
-                    logger.info("Queue item result: %s", msg)
-                    all_results.append(msg)
-                    await asyncio.sleep(1.0)
-                clear_queue()
+                results = await register_many(
+                    page, [(item["date"], item["time"]) for item in queued]
+                )
+                all_results.extend(results)
+                with queue_batch():
+                    for item in queued:
+                        remove_from_queue(item["date"], item["time"])
 
             # 2. Register all WEEKLY_CLASSES for the coming week
             weekly_results = await batch_register_next_week(page)
@@ -549,45 +692,94 @@ async def _scheduled_batch_register() -> None:
 # ── Main runner ───────────────────────────────────────────────────────────────
 
 def run_bot() -> None:
-    scheduler = AsyncIOScheduler(timezone=config.TIMEZONE)
+    # Jobs persist in SQLite so a restart around Saturday evening doesn't lose
+    # the trigger; a run missed while the bot was down still fires within the
+    # grace window.  replace_existing keeps restarts from duplicating it.
+    scheduler = AsyncIOScheduler(
+        jobstores={"default": SQLAlchemyJobStore(url=config.SCHEDULER_DB_URL)},
+        timezone=config.TIMEZONE,
+    )
     scheduler.add_job(
         _scheduled_batch_register,
         CronTrigger(day_of_week="sat", hour=21, minute=0, timezone=config.TIMEZONE),
         id="weekly_batch_register",
         replace_existing=True,
+        misfire_grace_time=3600,
+        coalesce=True,
     )
+    scheduler.add_job(
+        _refresh_saturday,
+        CronTrigger(hour=0, minute=0, timezone=config.TIMEZONE),
+        id="refresh_this_saturday",
+        replace_existing=True,
+        misfire_grace_time=3600,
+        coalesce=True,
+    )
+
+    warmup: set[asyncio.Task] = set()
+
+    async def _warm_up_session() -> None:
+        try:
+            await _session.start()
+            logger.info("Arbox session ready.")
+        except Exception:
+            logger.exception("Arbox session warm-up failed — will retry on first command")
 
     async def on_startup(app: Application) -> None:
+        _refresh_saturday()
+        # One Chromium for the whole process; handlers open contexts on it.
+        await start_browser()
+        # Log in to Arbox in the background so polling starts right away;
+        # commands arriving before it finishes wait on the session lock.
+        task = asyncio.create_task(_warm_up_session())
+        warmup.add(task)
+        task.add_done_callback(warmup.discard)
         scheduler.start()
         logger.info("Scheduler started — next batch registration: Saturday 21:00 Israel time.")
 
     async def on_shutdown(app: Application) -> None:
         scheduler.shutdown(wait=False)
         logger.info("Scheduler stopped.")
+        await _session.close()
+        await stop_browser()
+        await close_bot()
 
     app = (
         Application.builder()
         .token(config.TELEGRAM_TOKEN)
         .post_init(on_startup)
         .post_shutdown(on_shutdown)
+        .concurrent_updates(True)
         .build()
     )
 
+    # Every handler is non-blocking and serialized per chat (see _per_chat).
     # Command handlers (still work for power-users)
-    app.add_handler(CommandHandler("start",    cmd_start))
-    app.add_handler(CommandHandler("help",     cmd_help))
-    app.add_handler(CommandHandler("wod",      cmd_wod))
-    app.add_handler(CommandHandler("register", cmd_register))
-    app.add_handler(CommandHandler("cancel",   cmd_cancel))
-    app.add_handler(CommandHandler("bookweek", cmd_bookweek))
-    app.add_handler(CommandHandler("mystatus", cmd_mystatus))
-    app.add_handler(CommandHandler("myqueue",  cmd_myqueue))
+    app.add_handler(CommandHandler("start",    _per_chat(cmd_start),    block=False))
+    app.add_handler(CommandHandler("help",     _per_chat(cmd_help),     block=False))
+    app.add_handler(CommandHandler("wod",      _per_chat(cmd_wod),      block=False))
+    app.add_handler(CommandHandler("register", _per_chat(cmd_register), block=False))
+    app.add_handler(CommandHandler("cancel",   _per_chat(cmd_cancel),   block=False))
+    app.add_handler(CommandHandler("bookweek", _per_chat(cmd_bookweek), block=False))
+    app.add_handler(CommandHandler("mystatus", _per_chat(cmd_mystatus), block=False))
+    app.add_handler(CommandHandler("myqueue",  _per_chat(cmd_myqueue),  block=False))
 
     # Inline keyboard callbacks
-    app.add_handler(CallbackQueryHandler(handle_callback))
+    app.add_handler(CallbackQueryHandler(_per_chat(handle_callback), block=False))
 
-    # Reply keyboard button taps (text messages that are not commands)
-    app.add_handler(MessageHandler(filters.TEXT & ~filters.COMMAND, handle_menu_text))
+    # Reply keyboard button taps — only the menu texts reach the handler
+    app.add_handler(MessageHandler(
+        filters.Text(list(_MENU)), _per_chat(handle_menu_text), block=False
+    ))
 
     logger.info("Starting Telegram bot with long-polling…")
-    app.run_polling(allowed_updates=["message", "callback_query"])
+    # Real long-polling: each getUpdates waits up to 30 s for something to
+    # arrive, which suits a low-traffic personal bot.  Updates left over from
+    # a previous (crashed) process are dropped rather than replayed.
+    app.run_polling(
+        poll_interval=0,
+        timeout=30,
+        bootstrap_retries=-1,
+        allowed_updates=["message", "callback_query"],
+        drop_pending_updates=True,
+    )